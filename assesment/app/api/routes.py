@@ -5,9 +5,16 @@ from app.models.schemas import (
     AttendeeCreate,
     AttendeeOut,
     AttendeeListOut,
+    RegistrationListOut,
+    EventStatsListOut,
+    EventStatsDetailOut,
 )
-from app.repositories.repositories import EventRepository, AttendeeRepository
-from app.services.services import EventService, AttendeeService
+from app.repositories.repositories import (
+    EventRepository,
+    AttendeeRepository,
+    EventStatsRepository,
+)
+from app.services.services import EventService, AttendeeService, EventStatsService
 from typing import List
 from app.db.database import database
 
@@ -80,7 +87,7 @@ async def register_attendee(event_id: int, attendee: AttendeeCreate):
     Prevents overbooking and duplicate registrations.
     Returns 400 if registration fails.
     """
-    attendee_service = AttendeeService(AttendeeRepository(), EventRepository())
+    attendee_service = AttendeeService(AttendeeRepository(), EventRepository(), EventStatsRepository())
     try:
         return await attendee_service.register_attendee(event_id, attendee)
     except ValueError as e:
@@ -93,9 +100,51 @@ async def get_attendees(event_id: int):
     Get all registered attendees for an event.
     Returns 400 if query fails.
     """
-    attendee_service = AttendeeService(AttendeeRepository(), EventRepository())
+    attendee_service = AttendeeService(AttendeeRepository(), EventRepository(), EventStatsRepository())
     try:
         attendees = await attendee_service.get_attendees_for_event(event_id)
         return {"attendees": attendees}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/attendees", response_model=RegistrationListOut)
+async def get_registrations_by_email(email: str, limit: int = 10, offset: int = 0):
+    """
+    Get all registrations for an email across events, with pagination.
+    Email matching is case-insensitive. Returns 400 if query fails.
+    """
+    attendee_service = AttendeeService(AttendeeRepository(), EventRepository(), EventStatsRepository())
+    try:
+        registrations = await attendee_service.get_registrations_by_email(
+            email, limit=limit, offset=offset
+        )
+        return {"registrations": registrations}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stats/events", response_model=EventStatsListOut)
+async def list_event_stats(limit: int = 10, offset: int = 0):
+    """
+    Get fill percentage, registration rate and time to sell out for all events, with pagination.
+    Served from the registration rollup tables. Returns 400 if query fails.
+    """
+    stats_service = EventStatsService(EventStatsRepository())
+    try:
+        return {"events": await stats_service.list_event_stats(limit=limit, offset=offset)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/events/{event_id}/stats", response_model=EventStatsDetailOut)
+async def get_event_stats(event_id: int):
+    """
+    Get registration stats for an event, including registrations per hour.
+    Returns 404 if the event is not found.
+    """
+    stats_service = EventStatsService(EventStatsRepository())
+    try:
+        return await stats_service.get_event_stats(event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
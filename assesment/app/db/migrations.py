@@ -0,0 +1,90 @@
+from sqlalchemy import inspect, text
+
+from app.db.rollups import rebuild_event_stats
+from app.models.models import normalize_email
+
+
+def migrate_attendee_email_norm(engine, batch_size: int = 1000):
+    """
+    Add the attendees.email_norm column and its composite index to databases
+    created before it existed, then backfill it for existing rows.
+    Safe to run repeatedly; does nothing once the schema is up to date.
+    """
+    inspector = inspect(engine)
+    if "attendees" not in inspector.get_table_names():
+        return
+    columns = {col["name"] for col in inspector.get_columns("attendees")}
+
+    with engine.begin() as conn:
+        if "email_norm" not in columns:
+            conn.execute(
+                text("ALTER TABLE attendees ADD COLUMN email_norm VARCHAR NOT NULL DEFAULT ''")
+            )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_attendees_email_norm_event_id "
+                "ON attendees (email_norm, event_id)"
+            )
+        )
+        # Superseded by the composite index above
+        conn.execute(text("DROP INDEX IF EXISTS ix_attendees_email"))
+
+    # Backfill in batches walked by id, so rows whose email normalizes to ''
+    # are visited once; normalization is done in Python so it matches what
+    # the repository writes for new registrations.
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT id, email FROM attendees WHERE email_norm = '' AND id > :last_id "
+                    "ORDER BY id LIMIT :limit"
+                ),
+                {"last_id": last_id, "limit": batch_size},
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            conn.execute(
+                text("UPDATE attendees SET email_norm = :email_norm WHERE id = :id"),
+                [{"id": row.id, "email_norm": normalize_email(row.email)} for row in rows],
+            )
+
+
+def migrate_attendee_registered_at(engine):
+    """
+    Add the attendees.registered_at column to databases created before it existed.
+    Existing rows keep NULL since their registration time is unknown.
+    """
+    inspector = inspect(engine)
+    if "attendees" not in inspector.get_table_names():
+        return
+    columns = {col["name"] for col in inspector.get_columns("attendees")}
+    if "registered_at" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE attendees ADD COLUMN registered_at DATETIME"))
+
+
+def backfill_event_stats(engine):
+    """
+    Populate the registration rollups when they are empty but attendees of
+    existing events exist, e.g. the first start after the rollup tables were
+    introduced. Attendees left behind by deleted events never get a rollup
+    row, so they are ignored here.
+    """
+    with engine.connect() as conn:
+        has_stats = conn.execute(text("SELECT 1 FROM event_stats LIMIT 1")).first()
+        has_attendees = conn.execute(
+            text("SELECT 1 FROM attendees a JOIN events e ON e.id = a.event_id LIMIT 1")
+        ).first()
+    if has_attendees and not has_stats:
+        rebuild_event_stats(engine)
+
+
+def run_migrations(engine):
+    """
+    Apply in-place schema migrations that create_all cannot perform on existing tables.
+    """
+    migrate_attendee_email_norm(engine)
+    migrate_attendee_registered_at(engine)
+    backfill_event_stats(engine)
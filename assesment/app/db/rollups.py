@@ -0,0 +1,70 @@
+"""
+Rebuild the registration rollup tables (event_stats, event_registrations_hourly)
+from the attendees table. The registration path keeps them up to date
+incrementally; use this to recover if they drift or after a restore:
+
+    python -m app.db.rollups
+"""
+from sqlalchemy import text
+
+# Must match how SQLAlchemy's SQLite DateTime type stores values
+_HOUR_BUCKET_FORMAT = "%Y-%m-%d %H:00:00.000000"
+
+
+def rebuild_event_stats(engine):
+    """
+    Recompute both rollup tables from scratch in a single transaction.
+    Attendees without registered_at (registered before it was recorded) count
+    towards totals but not towards hourly buckets or registration times.
+    Returns the number of events with registrations.
+    """
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM event_registrations_hourly"))
+        conn.execute(text("DELETE FROM event_stats"))
+        conn.execute(
+            text(
+                """
+                WITH ranked AS (
+                    SELECT event_id, registered_at,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY event_id ORDER BY registered_at, id
+                           ) AS position
+                    FROM attendees
+                )
+                INSERT INTO event_stats (
+                    event_id, registration_count, timestamped_registration_count,
+                    first_registration_at, last_registration_at, sold_out_at
+                )
+                SELECT r.event_id, COUNT(*), COUNT(r.registered_at),
+                       MIN(r.registered_at), MAX(r.registered_at),
+                       MAX(CASE WHEN r.position = e.max_capacity THEN r.registered_at END)
+                FROM ranked r
+                JOIN events e ON e.id = r.event_id
+                GROUP BY r.event_id
+                """
+            )
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO event_registrations_hourly (event_id, hour_start, registrations)
+                SELECT a.event_id, strftime(:bucket_format, a.registered_at), COUNT(*)
+                FROM attendees a
+                JOIN events e ON e.id = a.event_id
+                WHERE a.registered_at IS NOT NULL
+                GROUP BY a.event_id, strftime(:bucket_format, a.registered_at)
+                """
+            ),
+            {"bucket_format": _HOUR_BUCKET_FORMAT},
+        )
+        return conn.execute(text("SELECT COUNT(*) FROM event_stats")).scalar()
+
+
+if __name__ == "__main__":
+    from app.db.database import Base, engine
+    from app.db.migrations import run_migrations
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    count = rebuild_event_stats(engine)
+    print(f"Rebuilt registration stats for {count} events")
@@ -1,9 +1,12 @@
 from fastapi import FastAPI
 from app.api.routes import router
 from app.db.database import Base, engine
+from app.db.migrations import run_migrations
 
 # Create tables
 Base.metadata.create_all(bind=engine)
+# Bring tables created by older versions up to date
+run_migrations(engine)
 
 app = FastAPI(title="Mini Event Management System")
 app.include_router(router)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
@@ -12,10 +12,49 @@ class Event(Base):
     max_capacity = Column(Integer, nullable=False)
     attendees = relationship("Attendee", back_populates="event")
 
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email for comparison: strip surrounding whitespace and lower-case it.
+    """
+    return email.strip().lower()
+
 class Attendee(Base):
     __tablename__ = "attendees"
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
-    email = Column(String, nullable=False, index=True)
+    email = Column(String, nullable=False)
+    # Lower-cased, trimmed copy of email used for dedupe and cross-event lookup
+    email_norm = Column(String, nullable=False)
+    # UTC; NULL for rows registered before this column existed
+    registered_at = Column(DateTime, nullable=True)
     event_id = Column(Integer, ForeignKey("events.id"))
     event = relationship("Event", back_populates="attendees")
+
+    __table_args__ = (
+        Index("ix_attendees_email_norm_event_id", "email_norm", "event_id"),
+    )
+
+
+class EventStats(Base):
+    """
+    Per-event registration rollup, updated incrementally on every registration.
+    Timestamps are UTC.
+    """
+    __tablename__ = "event_stats"
+    event_id = Column(Integer, ForeignKey("events.id"), primary_key=True)
+    registration_count = Column(Integer, nullable=False, default=0)
+    # Registrations with a registered_at; lower than registration_count when
+    # the event has attendees from before registration times were recorded
+    timestamped_registration_count = Column(Integer, nullable=False, default=0)
+    first_registration_at = Column(DateTime, nullable=True)
+    last_registration_at = Column(DateTime, nullable=True)
+    sold_out_at = Column(DateTime, nullable=True)
+
+class EventRegistrationsHourly(Base):
+    """
+    Registrations per event per UTC hour, updated incrementally on every registration.
+    """
+    __tablename__ = "event_registrations_hourly"
+    event_id = Column(Integer, ForeignKey("events.id"), primary_key=True)
+    hour_start = Column(DateTime, primary_key=True)
+    registrations = Column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 class EventCreate(BaseModel):
     name: str
@@ -34,3 +34,40 @@ class AttendeeOut(BaseModel):
 
 class AttendeeListOut(BaseModel):
     attendees: List[AttendeeOut]
+
+
+class RegistrationOut(BaseModel):
+    id: int
+    name: str
+    email: EmailStr
+    event_id: int
+    event_name: str
+    event_location: str
+    event_start_time: datetime
+    event_end_time: datetime
+
+class RegistrationListOut(BaseModel):
+    registrations: List[RegistrationOut]
+
+
+class EventStatsOut(BaseModel):
+    event_id: int
+    event_name: str
+    max_capacity: int
+    registration_count: int
+    fill_percentage: float
+    registrations_per_hour: Optional[float] = None
+    first_registration_at: Optional[datetime] = None
+    last_registration_at: Optional[datetime] = None
+    sold_out_at: Optional[datetime] = None
+    time_to_sell_out_seconds: Optional[float] = None
+
+class EventStatsListOut(BaseModel):
+    events: List[EventStatsOut]
+
+class HourlyRegistrationsOut(BaseModel):
+    hour_start: datetime
+    registrations: int
+
+class EventStatsDetailOut(EventStatsOut):
+    hourly: List[HourlyRegistrationsOut]
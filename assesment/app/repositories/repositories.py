@@ -1,6 +1,7 @@
 from app.db.database import database
-from app.models.models import Event, Attendee
-from sqlalchemy import select, insert, and_, func
+from app.models.models import Event, Attendee, EventStats, EventRegistrationsHourly, normalize_email
+from sqlalchemy import select, insert, delete, and_, case, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 class RepositoryError(Exception):
     """Custom exception for repository errors."""
@@ -51,14 +52,18 @@ class EventRepository:
 
     async def delete_event(self, event_id: int):
         """
-        Delete an event by ID.
+        Delete an event by ID, together with its registration rollups.
         Raises RepositoryError if not found or query fails.
         """
         try:
             event = await self.get_event(event_id)
-            from sqlalchemy import delete
-            query = delete(Event).where(Event.id == event_id)
-            await database.execute(query)
+            async with database.transaction():
+                await database.execute(
+                    delete(EventRegistrationsHourly).where(EventRegistrationsHourly.event_id == event_id)
+                )
+                await database.execute(delete(EventStats).where(EventStats.event_id == event_id))
+                query = delete(Event).where(Event.id == event_id)
+                await database.execute(query)
             return event
         except Exception as e:
             raise RepositoryError(f"Database error during deleting event: {str(e)}")
@@ -70,6 +75,7 @@ class AttendeeRepository:
         Raises RepositoryError if registration fails.
         """
         try:
+            attendee_data = {**attendee_data, "email_norm": normalize_email(attendee_data["email"])}
             query = insert(Attendee).values(**attendee_data)
             attendee_id = await database.execute(query)
             attendee = await self.get_attendee(attendee_id)
@@ -108,15 +114,47 @@ class AttendeeRepository:
     async def is_duplicate_registration(self, event_id: int, email: str) -> bool:
         """
         Check if an attendee with the given email is already registered for the event.
+        The comparison is case-insensitive and ignores surrounding whitespace.
         Raises RepositoryError if query fails.
         """
         try:
-            query = select(Attendee).where(and_(Attendee.event_id == event_id, Attendee.email == email))
+            query = select(Attendee.id).where(
+                and_(Attendee.email_norm == normalize_email(email), Attendee.event_id == event_id)
+            )
             row = await database.fetch_one(query)
             return row is not None
         except Exception as e:
             raise RepositoryError(f"Database error during duplicate check: {str(e)}")
 
+    async def get_registrations_by_email(self, email: str, limit=10, offset=0):
+        """
+        Fetch all registrations for an email across events, joined with event details.
+        Uses the (email_norm, event_id) index; results are ordered by event ID.
+        Raises RepositoryError if query fails.
+        """
+        try:
+            query = (
+                select(
+                    Attendee.id,
+                    Attendee.name,
+                    Attendee.email,
+                    Attendee.event_id,
+                    Event.name.label("event_name"),
+                    Event.location.label("event_location"),
+                    Event.start_time.label("event_start_time"),
+                    Event.end_time.label("event_end_time"),
+                )
+                .join(Event, Event.id == Attendee.event_id)
+                .where(Attendee.email_norm == normalize_email(email))
+                .order_by(Attendee.event_id)
+                .limit(limit)
+                .offset(offset)
+            )
+            rows = await database.fetch_all(query)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            raise RepositoryError(f"Database error during fetching registrations: {str(e)}")
+
     async def attendee_count(self, event_id: int) -> int:
         """
         Get the number of attendees registered for an event.
@@ -129,3 +167,122 @@ class AttendeeRepository:
             return list(result.values())[0] if result else 0
         except Exception as e:
             raise RepositoryError(f"Database error during attendee count: {str(e)}")
+
+
+class EventStatsRepository:
+    _stats_columns = (
+        Event.id.label("event_id"),
+        Event.name.label("event_name"),
+        Event.max_capacity,
+        func.coalesce(EventStats.registration_count, 0).label("registration_count"),
+        func.coalesce(EventStats.timestamped_registration_count, 0).label(
+            "timestamped_registration_count"
+        ),
+        EventStats.first_registration_at,
+        EventStats.last_registration_at,
+        EventStats.sold_out_at,
+    )
+
+    async def record_registration(self, event_id: int, registered_at, max_capacity: int):
+        """
+        Incrementally update the rollup tables for one new registration.
+        registered_at is a naive UTC datetime. Raises RepositoryError if the update fails.
+        """
+        try:
+            stats_insert = sqlite_insert(EventStats).values(
+                event_id=event_id,
+                registration_count=1,
+                timestamped_registration_count=1,
+                first_registration_at=registered_at,
+                last_registration_at=registered_at,
+                sold_out_at=registered_at if max_capacity <= 1 else None,
+            )
+            stats_query = stats_insert.on_conflict_do_update(
+                index_elements=[EventStats.event_id],
+                set_={
+                    "registration_count": EventStats.registration_count + 1,
+                    "timestamped_registration_count": EventStats.timestamped_registration_count + 1,
+                    "first_registration_at": func.coalesce(
+                        EventStats.first_registration_at, stats_insert.excluded.first_registration_at
+                    ),
+                    "last_registration_at": stats_insert.excluded.last_registration_at,
+                    "sold_out_at": case(
+                        (
+                            and_(
+                                EventStats.sold_out_at.is_(None),
+                                EventStats.registration_count + 1 >= max_capacity,
+                            ),
+                            stats_insert.excluded.last_registration_at,
+                        ),
+                        else_=EventStats.sold_out_at,
+                    ),
+                },
+            )
+            await database.execute(stats_query)
+
+            hour_start = registered_at.replace(minute=0, second=0, microsecond=0)
+            hourly_insert = sqlite_insert(EventRegistrationsHourly).values(
+                event_id=event_id, hour_start=hour_start, registrations=1
+            )
+            hourly_query = hourly_insert.on_conflict_do_update(
+                index_elements=[EventRegistrationsHourly.event_id, EventRegistrationsHourly.hour_start],
+                set_={"registrations": EventRegistrationsHourly.registrations + 1},
+            )
+            await database.execute(hourly_query)
+        except Exception as e:
+            raise RepositoryError(f"Database error during stats update: {str(e)}")
+
+    async def list_event_stats(self, limit=10, offset=0):
+        """
+        Fetch rollup stats for all events with pagination, ordered by event ID.
+        Events without registrations are included with a zero count.
+        Raises RepositoryError if query fails.
+        """
+        try:
+            query = (
+                select(*self._stats_columns)
+                .select_from(Event)
+                .outerjoin(EventStats, EventStats.event_id == Event.id)
+                .order_by(Event.id)
+                .limit(limit)
+                .offset(offset)
+            )
+            rows = await database.fetch_all(query)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            raise RepositoryError(f"Database error during fetching event stats: {str(e)}")
+
+    async def get_event_stats(self, event_id: int):
+        """
+        Fetch rollup stats for a single event.
+        Raises RepositoryError if the event is not found or query fails.
+        """
+        try:
+            query = (
+                select(*self._stats_columns)
+                .select_from(Event)
+                .outerjoin(EventStats, EventStats.event_id == Event.id)
+                .where(Event.id == event_id)
+            )
+            row = await database.fetch_one(query)
+            if not row:
+                raise RepositoryError(f"Event with id {event_id} not found")
+            return dict(row)
+        except Exception as e:
+            raise RepositoryError(f"Database error during fetching event stats: {str(e)}")
+
+    async def get_hourly_registrations(self, event_id: int):
+        """
+        Fetch registrations per UTC hour for an event, oldest first.
+        Raises RepositoryError if query fails.
+        """
+        try:
+            query = (
+                select(EventRegistrationsHourly.hour_start, EventRegistrationsHourly.registrations)
+                .where(EventRegistrationsHourly.event_id == event_id)
+                .order_by(EventRegistrationsHourly.hour_start)
+            )
+            rows = await database.fetch_all(query)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            raise RepositoryError(f"Database error during fetching hourly registrations: {str(e)}")
@@ -3,6 +3,7 @@ from app.db.database import database
 from app.repositories.repositories import (
     EventRepository,
     AttendeeRepository,
+    EventStatsRepository,
     RepositoryError,
 )
 from app.models.models import Event, Attendee
@@ -12,6 +13,17 @@ import pytz  # or use zoneinfo for Python 3.9+
 
 UTC = pytz.UTC
 IST = pytz.timezone("Asia/Kolkata")
+MAX_STATS_PAGE_SIZE = 100
+
+
+def _utcnow() -> datetime:
+    """Current time as a naive UTC datetime, the form stored for registration timestamps."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _utc_to_ist(dt):
+    """Convert a stored naive UTC datetime to IST, passing None through."""
+    return UTC.localize(dt).astimezone(IST) if dt is not None else None
 
 
 class EventService:
@@ -94,13 +106,20 @@ class EventService:
 
 
 class AttendeeService:
-    def __init__(self, attendee_repo: AttendeeRepository, event_repo: EventRepository):
+    def __init__(
+        self,
+        attendee_repo: AttendeeRepository,
+        event_repo: EventRepository,
+        stats_repo: EventStatsRepository,
+    ):
         self.attendee_repo = attendee_repo
         self.event_repo = event_repo
+        self.stats_repo = stats_repo
 
     async def register_attendee(self, event_id: int, attendee_data: AttendeeCreate):
         """
-        Register an attendee for an event. Raises ValueError for business or DB errors.
+        Register an attendee for an event and update the event's registration stats.
+        Raises ValueError for business or DB errors.
         """
         try:
             event = await self.event_repo.get_event(event_id)
@@ -116,7 +135,13 @@ class AttendeeService:
                 raise ValueError("Duplicate registration")
             attendee_dict = attendee_data.dict()
             attendee_dict["event_id"] = event_id
-            return await self.attendee_repo.register_attendee(attendee_dict)
+            attendee_dict["registered_at"] = _utcnow()
+            async with database.transaction():
+                attendee = await self.attendee_repo.register_attendee(attendee_dict)
+                await self.stats_repo.record_registration(
+                    event_id, attendee_dict["registered_at"], event.max_capacity
+                )
+            return attendee
         except RepositoryError as e:
             raise ValueError(str(e))
 
@@ -128,3 +153,97 @@ class AttendeeService:
             return await self.attendee_repo.get_attendees_for_event(event_id)
         except RepositoryError as e:
             raise ValueError(str(e))
+
+    async def get_registrations_by_email(self, email: str, limit=10, offset=0):
+        """
+        Get all registrations for an email across events with pagination.
+        Converts event times to IST before returning. Raises ValueError if query fails.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be greater than zero")
+        if offset < 0:
+            raise ValueError("Offset cannot be negative")
+        try:
+            registrations = await self.attendee_repo.get_registrations_by_email(
+                email, limit=limit, offset=offset
+            )
+            for registration in registrations:
+                registration["event_start_time"] = _utc_to_ist(registration["event_start_time"])
+                registration["event_end_time"] = _utc_to_ist(registration["event_end_time"])
+            return registrations
+        except RepositoryError as e:
+            raise ValueError(str(e))
+
+
+class EventStatsService:
+    def __init__(self, stats_repo: EventStatsRepository):
+        self.stats_repo = stats_repo
+
+    @staticmethod
+    def _build_stats(row: dict, now: datetime) -> dict:
+        """
+        Derive fill percentage, registration rate and time to sell out from a rollup row.
+        The rate is averaged from the first registration until sell-out (or now),
+        over at least one hour. Rate and time to sell out are None when any
+        registration predates registration timestamps, since they can't be measured.
+        """
+        count = row["registration_count"]
+        timestamped_count = row["timestamped_registration_count"]
+        first = row["first_registration_at"]
+        sold_out = row["sold_out_at"]
+        registrations_per_hour = None
+        time_to_sell_out = None
+        if timestamped_count == count:
+            registrations_per_hour = 0.0
+            if timestamped_count and first is not None:
+                hours = ((sold_out or now) - first).total_seconds() / 3600
+                registrations_per_hour = round(timestamped_count / max(hours, 1.0), 2)
+            if first is not None and sold_out is not None:
+                time_to_sell_out = (sold_out - first).total_seconds()
+        return {
+            "event_id": row["event_id"],
+            "event_name": row["event_name"],
+            "max_capacity": row["max_capacity"],
+            "registration_count": count,
+            "fill_percentage": round(count * 100 / row["max_capacity"], 2),
+            "registrations_per_hour": registrations_per_hour,
+            "first_registration_at": _utc_to_ist(first),
+            "last_registration_at": _utc_to_ist(row["last_registration_at"]),
+            "sold_out_at": _utc_to_ist(sold_out),
+            "time_to_sell_out_seconds": time_to_sell_out,
+        }
+
+    async def list_event_stats(self, limit=10, offset=0):
+        """
+        Get registration stats for all events with pagination, served from the rollups.
+        Raises ValueError if query fails.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be greater than zero")
+        if limit > MAX_STATS_PAGE_SIZE:
+            raise ValueError(f"Limit cannot exceed {MAX_STATS_PAGE_SIZE}")
+        if offset < 0:
+            raise ValueError("Offset cannot be negative")
+        try:
+            rows = await self.stats_repo.list_event_stats(limit=limit, offset=offset)
+            now = _utcnow()
+            return [self._build_stats(row, now) for row in rows]
+        except RepositoryError as e:
+            raise ValueError(str(e))
+
+    async def get_event_stats(self, event_id: int):
+        """
+        Get registration stats for one event, including registrations per hour.
+        Raises ValueError if the event is not found or query fails.
+        """
+        try:
+            row = await self.stats_repo.get_event_stats(event_id)
+            stats = self._build_stats(row, _utcnow())
+            hourly = await self.stats_repo.get_hourly_registrations(event_id)
+            stats["hourly"] = [
+                {"hour_start": _utc_to_ist(h["hour_start"]), "registrations": h["registrations"]}
+                for h in hourly
+            ]
+            return stats
+        except RepositoryError as e:
+            raise ValueError(str(e))
@@ -1,8 +1,15 @@
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
 
 # from app.main import app
 from app.main import app
+from app.db.database import Base, engine
+from app.db import migrations
+from app.db.migrations import migrate_attendee_email_norm
+from app.db.rollups import rebuild_event_stats
 
 client = TestClient(app)
 
@@ -237,3 +244,219 @@ def test_create_event_past_dates():
     )
    # We are showing empty array instead of 400
     assert resp.status_code == 200
+
+
+def _create_event(name, max_capacity=5):
+    resp = client.post(
+        "/events",
+        json={
+            "name": name,
+            "location": "Test Location",
+            "start_time": "2025-08-29T12:00:00+05:30",
+            "end_time": "2025-08-29T14:00:00+05:30",
+            "max_capacity": max_capacity,
+        },
+    )
+    return resp.json()["id"]
+
+
+def test_register_attendee_duplicate_case_insensitive():
+    # Test: Duplicate check ignores email case and surrounding whitespace
+    event_id = _create_event("Case Duplicate Event")
+    email = f"case-{uuid.uuid4().hex}@example.com"
+    client.post(f"/events/{event_id}/register", json={"name": "Case", "email": email})
+    dup_resp = client.post(
+        f"/events/{event_id}/register", json={"name": "Case", "email": email.upper()}
+    )
+    assert dup_resp.status_code == 400
+    assert "duplicate" in dup_resp.json()["detail"].lower()
+
+
+def test_get_registrations_by_email_across_events():
+    # Test: Lookup by email returns registrations from every event, case-insensitively
+    email = f"lookup-{uuid.uuid4().hex}@example.com"
+    event_ids = [_create_event(f"Lookup Event {i}") for i in range(3)]
+    for event_id in event_ids:
+        client.post(f"/events/{event_id}/register", json={"name": "Lookup", "email": email})
+
+    resp = client.get("/attendees", params={"email": email.upper()})
+    assert resp.status_code == 200
+    registrations = resp.json()["registrations"]
+    assert [r["event_id"] for r in registrations] == event_ids
+    assert registrations[0]["event_name"] == "Lookup Event 0"
+    assert registrations[0]["email"] == email
+    assert registrations[0]["event_start_time"] == "2025-08-29T12:00:00+05:30"
+    assert registrations[0]["event_end_time"] == "2025-08-29T14:00:00+05:30"
+
+    # Pagination
+    page = client.get("/attendees", params={"email": email, "limit": 2, "offset": 2})
+    assert [r["event_id"] for r in page.json()["registrations"]] == event_ids[2:]
+
+    bad = client.get("/attendees", params={"email": email, "limit": 0})
+    assert bad.status_code == 400
+
+
+def test_migrate_attendee_email_norm_backfills(tmp_path):
+    # Test: Migration adds email_norm to an old attendees table and backfills it
+    old_engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with old_engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE attendees (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL, "
+            "email VARCHAR NOT NULL, event_id INTEGER)"
+        ))
+        conn.execute(text("CREATE INDEX ix_attendees_email ON attendees (email)"))
+        conn.execute(text(
+            "INSERT INTO attendees (name, email, event_id) VALUES "
+            "('A', ' Mixed@Example.COM ', 1), ('Blank', '  ', 1), ('B', 'b@example.com', 2)"
+        ))
+
+    migrate_attendee_email_norm(old_engine, batch_size=1)
+    migrate_attendee_email_norm(old_engine)  # idempotent
+
+    with old_engine.connect() as conn:
+        rows = conn.execute(text("SELECT email_norm FROM attendees ORDER BY id")).fetchall()
+    assert [r.email_norm for r in rows] == ["mixed@example.com", "", "b@example.com"]
+    index_names = {ix["name"] for ix in inspect(old_engine).get_indexes("attendees")}
+    assert "ix_attendees_email_norm_event_id" in index_names
+    assert "ix_attendees_email" not in index_names
+
+
+def test_event_stats_updated_on_registration():
+    # Test: Registering attendees updates the event's rollup stats
+    event_id = _create_event("Stats Event", max_capacity=2)
+    resp = client.get(f"/events/{event_id}/stats")
+    assert resp.status_code == 200
+    assert resp.json()["registration_count"] == 0
+    assert resp.json()["fill_percentage"] == 0
+    assert resp.json()["hourly"] == []
+
+    for i in range(2):
+        client.post(
+            f"/events/{event_id}/register",
+            json={"name": f"Stats {i}", "email": f"stats-{uuid.uuid4().hex}@example.com"},
+        )
+    data = client.get(f"/events/{event_id}/stats").json()
+    assert data["registration_count"] == 2
+    assert data["fill_percentage"] == 100
+    assert data["registrations_per_hour"] == 2
+    assert data["sold_out_at"] is not None
+    assert data["time_to_sell_out_seconds"] >= 0
+    assert sum(h["registrations"] for h in data["hourly"]) == 2
+
+
+def test_event_stats_not_found():
+    # Test: Stats for a non-existent event return 404
+    resp = client.get("/events/99999/stats")
+    assert resp.status_code == 404
+    assert "not found" in resp.json()["detail"].lower()
+
+
+def test_list_event_stats():
+    # Test: Stats listing is ordered by event ID and respects limit bounds
+    empty_id = _create_event("Stats List Empty")
+    busy_id = _create_event("Stats List Busy", max_capacity=4)
+    client.post(
+        f"/events/{busy_id}/register",
+        json={"name": "Busy", "email": f"busy-{uuid.uuid4().hex}@example.com"},
+    )
+    assert client.get(f"/events/{empty_id}/stats").json()["registration_count"] == 0
+    assert client.get(f"/events/{busy_id}/stats").json()["fill_percentage"] == 25
+
+    resp = client.get("/stats/events", params={"limit": 100})
+    assert resp.status_code == 200
+    event_ids = [e["event_id"] for e in resp.json()["events"]]
+    assert 0 < len(event_ids) <= 100
+    assert event_ids == sorted(event_ids)
+
+    bad = client.get("/stats/events", params={"offset": -1})
+    assert bad.status_code == 400
+
+    too_large = client.get("/stats/events", params={"limit": 101})
+    assert too_large.status_code == 400
+    assert "limit" in too_large.json()["detail"].lower()
+
+
+def test_event_stats_with_legacy_registrations():
+    # Test: Rate and time to sell out are unknown when some registrations have no timestamp
+    event_id = _create_event("Legacy Stats Event", max_capacity=3)
+    with engine.begin() as conn:
+        for i in range(2):
+            conn.execute(
+                text(
+                    "INSERT INTO attendees (name, email, email_norm, event_id, registered_at) "
+                    "VALUES (:name, :email, :email, :event_id, NULL)"
+                ),
+                {"name": f"Legacy {i}", "email": f"legacy-{uuid.uuid4().hex}@example.com", "event_id": event_id},
+            )
+    rebuild_event_stats(engine)
+    client.post(
+        f"/events/{event_id}/register",
+        json={"name": "New", "email": f"new-{uuid.uuid4().hex}@example.com"},
+    )
+    data = client.get(f"/events/{event_id}/stats").json()
+    assert data["registration_count"] == 3
+    assert data["fill_percentage"] == 100
+    assert data["sold_out_at"] is not None
+    assert data["registrations_per_hour"] is None
+    assert data["time_to_sell_out_seconds"] is None
+    assert sum(h["registrations"] for h in data["hourly"]) == 1
+
+
+def test_rebuild_event_stats(tmp_path):
+    # Test: Rebuilding rollups from attendees recomputes counts, sell-out time and hourly buckets
+    stats_engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    Base.metadata.create_all(bind=stats_engine)
+    with stats_engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO events (id, name, location, start_time, end_time, max_capacity) VALUES "
+            "(1, 'A', 'L', '2025-08-29 06:30:00.000000', '2025-08-29 08:30:00.000000', 2), "
+            "(2, 'B', 'L', '2025-08-29 06:30:00.000000', '2025-08-29 08:30:00.000000', 5)"
+        ))
+        conn.execute(text(
+            "INSERT INTO attendees (name, email, email_norm, event_id, registered_at) VALUES "
+            "('a', 'a@x.com', 'a@x.com', 1, NULL), "
+            "('b', 'b@x.com', 'b@x.com', 1, '2025-08-01 10:15:00.000000'), "
+            "('c', 'c@x.com', 'c@x.com', 2, '2025-08-01 10:05:00.000000'), "
+            "('d', 'd@x.com', 'd@x.com', 2, '2025-08-01 10:45:00.000000'), "
+            "('e', 'e@x.com', 'e@x.com', 2, '2025-08-01 11:30:00.000000')"
+        ))
+        conn.execute(text(
+            "INSERT INTO event_stats (event_id, registration_count, timestamped_registration_count) "
+            "VALUES (1, 99, 99)"
+        ))
+
+    assert rebuild_event_stats(stats_engine) == 2
+
+    with stats_engine.connect() as conn:
+        stats = conn.execute(text(
+            "SELECT event_id, registration_count, timestamped_registration_count, sold_out_at "
+            "FROM event_stats ORDER BY event_id"
+        )).fetchall()
+        hourly = conn.execute(text(
+            "SELECT event_id, hour_start, registrations FROM event_registrations_hourly "
+            "ORDER BY event_id, hour_start"
+        )).fetchall()
+    assert [tuple(r) for r in stats] == [
+        (1, 2, 1, "2025-08-01 10:15:00.000000"),
+        (2, 3, 3, None),
+    ]
+    assert [tuple(r) for r in hourly] == [
+        (1, "2025-08-01 10:00:00.000000", 1),
+        (2, "2025-08-01 10:00:00.000000", 2),
+        (2, "2025-08-01 11:00:00.000000", 1),
+    ]
+
+
+def test_backfill_event_stats_ignores_orphaned_attendees(tmp_path, monkeypatch):
+    # Test: Attendees of deleted events don't trigger a rollup rebuild on every startup
+    orphan_engine = create_engine(f"sqlite:///{tmp_path / 'orphan.db'}")
+    Base.metadata.create_all(bind=orphan_engine)
+    with orphan_engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO attendees (name, email, email_norm, event_id) "
+            "VALUES ('a', 'a@x.com', 'a@x.com', 42)"
+        ))
+    rebuilds = []
+    monkeypatch.setattr(migrations, "rebuild_event_stats", rebuilds.append)
+    migrations.backfill_event_stats(orphan_engine)
+    assert rebuilds == []